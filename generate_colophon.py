@@ -5,24 +5,117 @@ Creates a JSON file suitable for ingestion by a NextJS homepage application.
 """
 
 import argparse
+import functools
 import json
+import operator
+import os
 import re
 import sys
-from datetime import UTC
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from itertools import chain
 from pathlib import Path
 from typing import ClassVar
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Precompiled patterns, hoisted to module scope so the cost of compiling (and of
+# re's per-call pattern-cache lookup) is paid once instead of per README/CREDITS file.
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_MD_EMPHASIS_RE = re.compile(r"[*_]{1,2}([^*_]+)[*_]{1,2}")
+_MD_CODE_RE = re.compile(r"`([^`]+)`")
+_HEADING_LINE_RE = re.compile(r"^#+\s+.*$", re.MULTILINE)
+_DOT_RUN_RE = re.compile(r"\s*\.\s*\.\s*")
+_WS_RE = re.compile(r"\s+")
+# Combined bullet-to-sentence pattern: the string-start bullet keeps just the
+# capitalized letter, later bullets become sentence breaks. One pass instead of two.
+_BULLET_RE = re.compile(r"\A\s*[-*]\s+(?P<first>[A-Za-z])|\s*[-*]\s+(?P<rest>[A-Za-z])")
+
+
+def _bullet_to_sentence(match: re.Match) -> str:
+    """Dispatch a _BULLET_RE match to its replacement."""
+    first = match.group("first")
+    if first is not None:
+        return first.upper()
+    return f". {match.group('rest').upper()}"
+
+
+@functools.cache
+def _emoji_translation() -> dict[int, None]:
+    """Build a deletion table for emoji code points on first use.
+
+    str.translate with a C-level table lookup beats a big character-class
+    regex for bulk codepoint removal; the ranges mirror the old _EMOJI_RE.
+    """
+    return dict.fromkeys(
+        chain(
+            range(0x1F600, 0x1F650),
+            range(0x1F300, 0x1F600),
+            range(0x1F680, 0x1F700),
+            range(0x1F1E0, 0x1F200),
+            range(0x2702, 0x27B1),
+            range(0x24C2, 0x1F252),
+            range(0x1F900, 0x1FA00),
+            range(0x1FA00, 0x1FA70),
+            range(0x1FA70, 0x1FB00),
+        )
+    )
+
+
+_DESC_SECTION_RES = [
+    re.compile(
+        r"##\s+(?:Project Purpose|Description|Overview|About)\s*\n+(.+?)(?=\n##|\Z)",
+        re.IGNORECASE | re.DOTALL,
+    ),
+    # First section content after any H2
+    re.compile(r"##\s+.+?\s*\n+(.+?)(?=\n##|\Z)", re.IGNORECASE | re.DOTALL),
+]
+# Only the heading is matched by regex; the section body is taken as a bounded
+# slice afterwards, so a README without a closing "##" cannot make the DOTALL
+# group swallow (and hold) the whole remaining file.
+_TAGS_HEADING_RE = re.compile(r"##\s+(?:Tags|Keywords|Categories)[\s:]*\n", re.IGNORECASE)
+_TAGS_WINDOW = 4096
+_BADGE_RE = re.compile(r"!\[([^\]]+)\]")
+# GitHub links, both markdown ([text](https://github.com/user/repo)) and bare
+# (https://github.com/user/repo), combined so one pass covers the whole text
+_GH_COMBINED_RE = re.compile(
+    r"\[[^\]]+\]\((?:https?://)?(?:www\.)?github\.com/(?P<md>[^/]+)/[^)]+\)"
+    r"|(?:https?://)?(?:www\.)?github\.com/(?P<bare>[^/]+)/[^\s\)\]<>]+",
+    re.IGNORECASE,
+)
+_AUTHOR_SECTION_RE = re.compile(r"##\s+Authors?\s*\n+(.+?)(?=\n##|\Z)", re.IGNORECASE | re.DOTALL)
+_AUTHOR_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^\)]+)\)")
+_AUTHOR_GITHUB_RE = re.compile(r"(?:https?://)?(?:www\.)?github\.com/([^/\s\)]+)", re.IGNORECASE)
+_AUTHOR_PREFIX_RE = re.compile(
+    r"^(Created (by|with\s+\S+\s+by)|Written by|Author:?)\s*", re.IGNORECASE
+)
+_H2_HEADING_RE = re.compile(r"##\s+(.+)")
+_ML_NAME_RE = re.compile(r"^[-*]\s+(.+)$")
+_ML_URL_RE = re.compile(r"^[-*]\s+(https?://[^\s]+)$")
+_CREDIT_LINK_FIRST_RE = re.compile(r"^[-*]\s*\[([^\]]+)\]\(([^\)]+)\)(?:\s*[-:–—]\s*(.+))?$")
+_CREDIT_LINK_EMBEDDED_RE = re.compile(r"^[-*]\s*(.+?)\s*\[([^\]]+)\]\(([^\)]+)\)\s*(.*)$")
+# "- Name - description [text](url)" is parsed in two stages: the old single
+# pattern stacked two lazy groups in front of the link scan and went quadratic
+# (effectively hanging) on long dash-heavy lines with no matching link.
+_CREDIT_LINK_AT_EOL_RE = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)$")
+_CREDIT_NAME_DESC_RE = re.compile(r"^[-*]\s*(.+?)\s*[-:–—]\s*(.+?)\s*$")
+_CREDIT_NO_LINK_RE = re.compile(r"^[-*]\s*(.+?)\s*[-:–—]\s+(.+)$")
+_E_DASH_WORD_RE = re.compile(r"\b[eE]-\w")
+
+# Header marker for apps copied from simonw/tools
+_SIMONW_MARKER = "From https://github.com/simonw/tools"
+
 
 class ColophonGenerator:
     """Generator for combined colophon from app documentation."""
 
-    def __init__(self, repo_root: Path | None = None, output_path: Path | None = None):
-        """Initialize the generator with repository root path."""
-        self.repo_root = repo_root or Path.cwd()
-        self.output_path = output_path or self.repo_root / "colophon.json"
-
-        # Directories to exclude from app scanning
-        self.exclude_dirs = {
+    # Directories to exclude from app scanning; constant, so shared by all instances
+    EXCLUDE_DIRS: ClassVar[frozenset[str]] = frozenset(
+        {
             "templates",
             "nginx",
             ".git",
@@ -31,6 +124,17 @@ class ColophonGenerator:
             ".venv",
             "venv",
         }
+    )
+
+    def __init__(self, repo_root: Path | None = None, output_path: Path | None = None):
+        """Initialize the generator with repository root path."""
+        self.repo_root = repo_root or Path.cwd()
+        self.output_path = output_path or self.repo_root / "colophon.json"
+        # Sidecar cache keyed by README/CREDITS mtimes so unchanged apps skip
+        # the reads and regex work entirely on incremental regenerations.
+        self.cache_path = self.output_path.with_suffix(".cache.json")
+        self._cache: dict = {}
+        self._new_cache: dict = {}
 
     def generate(self) -> None:
         """Generate the combined colophon file."""
@@ -40,16 +144,24 @@ class ColophonGenerator:
         print(f"Found {len(apps)} apps")
 
         colophon_data = []
+        self._cache = self._load_cache()
+
+        # Each app is an independent unit of file I/O plus regex work, so fan the
+        # extraction out across threads in readdir order; the final sort below
+        # restores the stable name ordering of the output.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            results = executor.map(
+                lambda app: (app[0], self._extract_app_info(app[0], app[1], app[2])),
+                apps,
+            )
+            for app_name, app_info in results:
+                if app_info:
+                    colophon_data.append(app_info)
+                    print(f"  ✓ Processed: {app_name}")
+                else:
+                    print(f"  ⚠ Skipped: {app_name} (missing README.md)")
 
-        for app_name in sorted(apps):
-            app_dir = self.repo_root / "apps" / app_name
-            app_info = self._extract_app_info(app_name, app_dir)
-
-            if app_info:
-                colophon_data.append(app_info)
-                print(f"  ✓ Processed: {app_name}")
-            else:
-                print(f"  ⚠ Skipped: {app_name} (missing README.md)")
+        colophon_data.sort(key=operator.itemgetter("name"))
 
         # Write output
         output_data = {
@@ -58,14 +170,38 @@ class ColophonGenerator:
             "apps": colophon_data,
         }
 
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            self.output_path.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            self.output_path.write_bytes(
+                json.dumps(output_data, indent=2, ensure_ascii=False).encode("utf-8")
+            )
+
+        self._write_cache()
 
         print(f"\n✓ Generated colophon: {self.output_path}")
         print(f"  Total apps: {len(colophon_data)}")
 
-    def _discover_apps(self) -> list[str]:
-        """Discover all app directories in the repository."""
+    def _load_cache(self) -> dict:
+        """Load the sidecar extraction cache from a previous run, if any."""
+        try:
+            data = json.loads(self.cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_cache(self) -> None:
+        """Persist the mtime-keyed extraction cache next to the output."""
+        try:
+            if orjson is not None:
+                self.cache_path.write_bytes(orjson.dumps(self._new_cache))
+            else:
+                self.cache_path.write_bytes(json.dumps(self._new_cache).encode("utf-8"))
+        except OSError:
+            pass
+
+    def _discover_apps(self) -> list[tuple[str, str, bool]]:
+        """Discover app directories as (name, path, has_credits) tuples."""
         apps = []
 
         # Look in the apps/ subdirectory
@@ -73,43 +209,78 @@ class ColophonGenerator:
         if not apps_dir.exists():
             return apps
 
-        for item in apps_dir.iterdir():
-            # Skip if not a directory
-            if not item.is_dir():
-                continue
+        with os.scandir(apps_dir) as it:
+            for entry in it:
+                # Skip excluded directories before touching the filesystem again
+                if entry.name in self.EXCLUDE_DIRS or entry.name.startswith("."):
+                    continue
 
-            # Skip excluded directories
-            if item.name in self.exclude_dirs or item.name.startswith("."):
-                continue
+                # Skip if not a directory (d_type is cached; no extra stat on Linux)
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
 
-            # Check if it has a Dockerfile (indicating it's an app)
-            if (item / "Dockerfile").exists() or (item / "README.md").exists():
-                apps.append(item.name)
+                # Check if it has a Dockerfile (indicating it's an app) with one
+                # directory listing instead of two exists() probes
+                try:
+                    children = os.listdir(entry.path)
+                except OSError:
+                    continue
+                if "Dockerfile" in children or "README.md" in children:
+                    # Keep the scandir path string; Path construction per app
+                    # (and per child file) is avoidable allocation. The listing
+                    # already tells us whether CREDITS.md exists, so thread that
+                    # through and spare the later stat on credit-less apps.
+                    apps.append((entry.name, entry.path, "CREDITS.md" in children))
 
         return apps
 
-    def _extract_app_info(self, app_name: str, app_dir: Path) -> dict | None:
+    def _extract_app_info(
+        self, app_name: str, app_dir: str, has_credits: bool = True
+    ) -> dict | None:
         """Extract information from an app's README.md and CREDITS.md."""
-        readme_path = app_dir / "README.md"
-        credits_path = app_dir / "CREDITS.md"
+        readme_path = os.path.join(app_dir, "README.md")
+        credits_path = os.path.join(app_dir, "CREDITS.md")
 
-        # README.md is required
-        if not readme_path.exists():
+        # README.md is required; its stat doubles as the existence check
+        try:
+            readme_mtime = os.stat(readme_path).st_mtime
+        except OSError:
             return None
-
-        # Read README
-        with open(readme_path, encoding="utf-8") as f:
-            readme_content = f.read()
+        credits_mtime = None
+        if has_credits:
+            try:
+                credits_mtime = os.stat(credits_path).st_mtime
+            except OSError:
+                pass
+
+        # Unchanged apps reuse the cached extraction from the previous run
+        cached = self._cache.get(app_name)
+        if (
+            cached
+            and cached.get("readme_mtime") == readme_mtime
+            and cached.get("credits_mtime") == credits_mtime
+        ):
+            self._new_cache[app_name] = cached
+            return cached["info"]
+
+        # Read as bytes and decode in one shot; ASCII-only files (the common
+        # case here) take the cheaper ascii codec instead of the utf-8 decoder
+        with open(readme_path, "rb") as f:
+            data = f.read()
+        readme_content = data.decode("ascii") if data.isascii() else data.decode("utf-8")
 
         # Read CREDITS if it exists
         credits_content = ""
-        if credits_path.exists():
-            with open(credits_path, encoding="utf-8") as f:
-                credits_content = f.read()
-
-        # Extract information
-        title = self._extract_title(readme_content, app_name)
-        description = self._extract_description(readme_content)
+        if credits_mtime is not None:
+            with open(credits_path, "rb") as f:
+                data = f.read()
+            credits_content = data.decode("ascii") if data.isascii() else data.decode("utf-8")
+
+        # Extract information; the H1 search result is shared so the
+        # description pass can strip the title by span instead of re-matching
+        title_match = _TITLE_RE.search(readme_content)
+        title = self._extract_title(title_match, app_name)
+        description = self._extract_description(readme_content, title_match)
         tags = self._extract_tags(readme_content)
         author = self._extract_author(credits_content, readme_content)
         credits = self._parse_credits(credits_content, readme_content)
@@ -126,40 +297,41 @@ class ColophonGenerator:
         if author:
             app_info["author"] = author
 
+        self._new_cache[app_name] = {
+            "readme_mtime": readme_mtime,
+            "credits_mtime": credits_mtime,
+            "info": app_info,
+        }
         return app_info
 
-    def _extract_title(self, readme_content: str, fallback: str) -> str:
+    def _extract_title(self, title_match: re.Match | None, fallback: str) -> str:
         """Extract title from README.md (first H1 heading)."""
-        # Look for first # heading
-        match = re.search(r"^#\s+(.+)$", readme_content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
+        if title_match:
+            return title_match.group(1).strip()
 
         # Fallback to app name, formatted nicely
         return fallback.replace("-", " ").replace("_", " ").title()
 
-    def _clean_description(self, text: str) -> str:
-        """Remove Markdown formatting and emojis from text, converting lists to sentences."""
-        text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-        text = re.sub(r"[*_]{1,2}([^*_]+)[*_]{1,2}", r"\1", text)
-        text = re.sub(r"`([^`]+)`", r"\1", text)
-        text = re.sub(r"^#+\s+.*$", "", text, flags=re.MULTILINE)
-        text = re.sub(
-            r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
-            r"\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251"
-            r"\U0001F900-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF]",
-            "",
-            text,
-        )
-
-        def capitalize_after_marker(match: re.Match) -> str:
-            return match.group(1).upper()
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _clean_description(text: str) -> str:
+        """Remove Markdown formatting and emojis from text, converting lists to sentences.
 
-        text = re.sub(r"^\s*[-*]\s+([A-Za-z])", capitalize_after_marker, text)
-        text = re.sub(r"\s*[-*]\s+([A-Za-z])", lambda m: f". {m.group(1).upper()}", text)
-
-        text = " ".join(text.split())
-        text = re.sub(r"\s*\.\s*\.\s*", ". ", text)
+        Cached by input string: templated apps share boilerplate descriptions,
+        and repeats skip the whole substitution pipeline.
+        """
+        text = _MD_LINK_RE.sub(r"\1", text)
+        text = _MD_EMPHASIS_RE.sub(r"\1", text)
+        text = _MD_CODE_RE.sub(r"\1", text)
+        text = _HEADING_LINE_RE.sub("", text)
+        # Most descriptions are pure ASCII; skip the emoji pass entirely for them
+        if not text.isascii():
+            text = text.translate(_emoji_translation())
+
+        text = _BULLET_RE.sub(_bullet_to_sentence, text)
+
+        text = _WS_RE.sub(" ", text).strip()
+        text = _DOT_RUN_RE.sub(". ", text)
         text = text.strip()
         if text and not text[0].isupper():
             text = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
@@ -167,38 +339,49 @@ class ColophonGenerator:
             text += "."
         return text
 
-    def _extract_description(self, readme_content: str) -> str:
+    def _extract_description(self, readme_content: str, title_match: re.Match | None) -> str:
         """Extract description from README.md."""
         # Handle special case for apps copied from simonw/tools
         # Format: "# Title\n\nFrom <url>\n\nDescription here\n\n<!-- Generated... -->"
-        lines = readme_content.split("\n")
-        if len(lines) >= 5 and lines[2].strip().startswith("From https://github.com/simonw/tools"):
-            # Description is on line 4 (index 4) for simonw/tools format
-            description = lines[4].strip()
-            if description:
-                description = self._clean_description(description)
-                return description if description else "No description available."
+        # Cheap substring probe first so the common case skips the line split;
+        # the bounded split only materializes the header lines we inspect.
+        if _SIMONW_MARKER in readme_content:
+            lines = readme_content.split("\n", 5)
+            if len(lines) >= 5 and lines[2].strip().startswith(_SIMONW_MARKER):
+                # Description is on line 4 (index 4) for simonw/tools format
+                description = lines[4].strip()
+                if description:
+                    description = self._clean_description(description)
+                    return description if description else "No description available."
 
-        # Remove the title (first H1)
-        content = re.sub(r"^#\s+.+$", "", readme_content, count=1, flags=re.MULTILINE)
+        # Remove the title (first H1) by slicing out the span already found
+        # by the shared _TITLE_RE search; no second regex pass needed
+        if title_match:
+            content = readme_content[: title_match.start()] + readme_content[title_match.end() :]
+        else:
+            content = readme_content
 
         # Look for text after common description headings
-        desc_patterns = [
-            r"##\s+(?:Project Purpose|Description|Overview|About)\s*\n+(.+?)(?=\n##|\Z)",
-            r"##\s+.+?\s*\n+(.+?)(?=\n##|\Z)",  # First section content after any H2
-        ]
-
-        for pattern in desc_patterns:
-            match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+        for pattern in _DESC_SECTION_RES:
+            match = pattern.search(content)
             if match:
                 description = self._clean_description(match.group(1).strip())
                 if description:
                     return description
 
-        # Fallback: Extract first paragraph after title
-        paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
-
-        for para in paragraphs:
+        # Fallback: Extract first paragraph after title. Walk the "\n\n"
+        # boundaries instead of splitting the whole file, so the scan stops
+        # at the first qualifying paragraph near the top.
+        pos = 0
+        content_len = len(content)
+        while pos < content_len:
+            end = content.find("\n\n", pos)
+            if end == -1:
+                end = content_len
+            para = content[pos:end].strip()
+            pos = end + 2
+            if not para:
+                continue
             # Skip if it's a heading
             if para.startswith("#"):
                 continue
@@ -249,37 +432,61 @@ class ColophonGenerator:
         (r"webassembly|wasm", "WebAssembly"),
     ]
 
-    def _extract_tags(self, readme_content: str) -> list[str]:
-        """Extract tags from README.md using data-driven pattern matching."""
-        tags = []
+    _TECH_TAG_BY_GROUP: ClassVar[dict[str, str]] = {
+        f"t{i}": tag for i, (_, tag) in enumerate(TECH_PATTERNS)
+    }
 
-        # Look for a Tags or Keywords section
-        tags_section = re.search(
-            r"##\s+(Tags|Keywords|Categories)[\s:]*\n(.+?)(?=\n##|\Z)",
-            readme_content,
-            re.IGNORECASE | re.DOTALL,
+    @classmethod
+    @functools.cache
+    def _tech_combined(cls) -> re.Pattern[str]:
+        """Compile the TECH_PATTERNS alternation lazily, once per process.
+
+        A single named-group alternation means the README is scanned once
+        instead of once per pattern, and deferring the compile keeps it off
+        the import path for invocations that never extract tags.
+        """
+        return re.compile(
+            "|".join(f"(?P<t{i}>{pattern})" for i, (pattern, _) in enumerate(cls.TECH_PATTERNS)),
+            re.IGNORECASE,
         )
 
-        if tags_section:
-            tags_text = tags_section.group(2)
-            # Extract from comma-separated list or bullet points
-            tag_matches = re.findall(r"[-*]\s*(.+)|([^,\n]+)", tags_text)
-            for match in tag_matches:
-                tag = (match[0] or match[1]).strip()
-                if tag and not tag.startswith("#"):
-                    tags.append(tag)
+    def _extract_tags(self, readme_content: str) -> list[str]:
+        """Extract tags from README.md using data-driven pattern matching."""
+        tags = []
+        # Shadow set for O(1) membership; the list keeps insertion order
+        tags_seen = set()
+
+        # Look for a Tags or Keywords section; cap the body at a fixed window
+        # past the heading and cut at the next section marker
+        tags_heading = _TAGS_HEADING_RE.search(readme_content)
+
+        if tags_heading:
+            window = readme_content[tags_heading.end() : tags_heading.end() + _TAGS_WINDOW]
+            cut = window.find("\n##")
+            tags_text = window[:cut] if cut != -1 else window
+            # Extract from comma-separated list or bullet points; plain splits
+            # replace the old ambiguous two-group findall pattern
+            for line in tags_text.split("\n"):
+                for raw in line.split(","):
+                    tag = raw.lstrip(" \t-*").strip()
+                    if tag and not tag.startswith("#"):
+                        tags.append(tag)
+                        tags_seen.add(tag)
 
         # Also look for badges/shields that might indicate technology
-        badge_matches = re.findall(r"!\[([^\]]+)\]", readme_content)
+        badge_matches = _BADGE_RE.findall(readme_content)
         for badge in badge_matches:
-            if badge and badge not in tags:
+            if badge and badge not in tags_seen:
                 tags.append(badge)
+                tags_seen.add(badge)
 
-        # Extract technology tags using pattern matching
-        content_lower = readme_content.lower()
-        for pattern, canonical_tag in self.TECH_PATTERNS:
-            if re.search(pattern, content_lower, re.IGNORECASE) and canonical_tag not in tags:
+        # Extract technology tags using pattern matching (one combined pass);
+        # the pattern is case-insensitive already, so no lowercased copy is needed
+        matched_groups = {m.lastgroup for m in self._tech_combined().finditer(readme_content)}
+        for group, canonical_tag in self._TECH_TAG_BY_GROUP.items():
+            if group in matched_groups and canonical_tag not in tags_seen:
                 tags.append(canonical_tag)
+                tags_seen.add(canonical_tag)
 
         # Normalize tags: lowercase, trimmed, deduped
         normalized_tags = []
@@ -288,9 +495,9 @@ class ColophonGenerator:
             tag_normalized = tag.strip().lower()
             if tag_normalized and tag_normalized not in seen:
                 seen.add(tag_normalized)
-                # Title case for display
-                tag_title = tag_normalized.title()
-                normalized_tags.append(tag_title)
+                # Title case for display; interned since the same handful of
+                # tech tags repeats across every app in the output
+                normalized_tags.append(sys.intern(tag_normalized.title()))
 
         return normalized_tags[:10]
 
@@ -305,33 +512,33 @@ class ColophonGenerator:
 
         Returns a list of dicts with 'name' (username) and 'url' (full link).
         """
-        github_patterns = [
-            # Markdown links: [text](https://github.com/user/repo)
-            r"\[([^\]]+)\]\((?:https?://)?(?:www\.)?github\.com/([^/]+)/[^)]+\)",
-            # Bare URLs: https://github.com/user/repo or www.github.com/user/repo
-            r"(?:https?://)?(?:www\.)?github\.com/([^/]+)/[^\s\)\]<>]+",
-        ]
+        # Fast path: no "github.com" substring means the pattern cannot match
+        if "github.com" not in text.lower():
+            return []
+
+        # One pass over the text; markdown-link usernames keep priority over
+        # bare-URL ones, matching the old two-pattern ordering
+        md_usernames = []
+        bare_usernames = []
+        for match in _GH_COMBINED_RE.finditer(text):
+            username = match.group("md")
+            if username is not None:
+                md_usernames.append(username)
+            else:
+                bare_usernames.append(match.group("bare"))
 
         usernames = []
         seen = set()
 
-        for pattern in github_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Extract username (second group for markdown links, first for bare URLs)
-                if len(match.groups()) >= 2:
-                    username = match.group(2).strip()
-                else:
-                    username = match.group(1).strip()
+        for username in md_usernames + bare_usernames:
+            # Clean username (remove trailing slashes, etc.)
+            username = username.strip().rstrip("/")
 
-                # Clean username (remove trailing slashes, etc.)
-                username = username.rstrip("/")
-
-                if username and username not in seen:
-                    seen.add(username)
-                    # Reconstruct the full GitHub URL
-                    full_url = f"https://github.com/{username}"
-                    usernames.append({"name": username, "url": full_url})
+            if username and username not in seen:
+                seen.add(username)
+                # Reconstruct the full GitHub URL
+                full_url = f"https://github.com/{username}"
+                usernames.append({"name": username, "url": full_url})
 
         return usernames
 
@@ -342,11 +549,7 @@ class ColophonGenerator:
         """
         # First, look for Author section in CREDITS.md
         if credits_content.strip():
-            author_match = re.search(
-                r"##\s+Authors?\s*\n+(.+?)(?=\n##|\Z)",
-                credits_content,
-                re.IGNORECASE | re.DOTALL,
-            )
+            author_match = _AUTHOR_SECTION_RE.search(credits_content)
             if author_match:
                 author_section = author_match.group(1).strip()
                 author = self._parse_author_content(author_section)
@@ -370,7 +573,7 @@ class ColophonGenerator:
     def _parse_author_content(self, content: str) -> dict | None:
         """Parse author content to extract name and URL."""
         # Look for markdown link pattern: [name](url)
-        link_match = re.search(r"\[([^\]]+)\]\((https?://[^\)]+)\)", content)
+        link_match = _AUTHOR_LINK_RE.search(content)
         if link_match:
             return {
                 "name": link_match.group(1).strip(),
@@ -378,11 +581,7 @@ class ColophonGenerator:
             }
 
         # Look for GitHub URL pattern
-        github_match = re.search(
-            r"(?:https?://)?(?:www\.)?github\.com/([^/\s\)]+)",
-            content,
-            re.IGNORECASE,
-        )
+        github_match = _AUTHOR_GITHUB_RE.search(content)
         if github_match:
             username = github_match.group(1).strip().rstrip("/")
             return {"name": username, "url": f"https://github.com/{username}"}
@@ -390,12 +589,7 @@ class ColophonGenerator:
         # Fallback: just use the first line as author name
         first_line = content.split("\n")[0].strip()
         # Clean up common prefixes
-        first_line = re.sub(
-            r"^(Created (by|with\s+\S+\s+by)|Written by|Author:?)\s*",
-            "",
-            first_line,
-            flags=re.IGNORECASE,
-        )
+        first_line = _AUTHOR_PREFIX_RE.sub("", first_line)
         if first_line:
             return {"name": first_line}
 
@@ -425,25 +619,44 @@ class ColophonGenerator:
         if not content.strip():
             return []
 
+        # Every credit format starts with a bullet marker; prose-only files can
+        # skip the section and line parsing entirely
+        if "-" not in content and "*" not in content:
+            return []
+
         credits = []
         matched_lines = set()
 
-        sections = re.split(r"\n(?=##\s+)", content)
+        # Group lines into "## "-headed sections manually; cheaper than a
+        # lookahead-based re.split over the whole file
+        sections = []
+        current: list[str] = []
+        for line in content.split("\n"):
+            if current and line.startswith("##") and len(line) > 2 and line[2].isspace():
+                sections.append("\n".join(current))
+                current = [line]
+            else:
+                current.append(line)
+        if current:
+            sections.append("\n".join(current))
 
         for section in sections:
             section = section.strip()
             if not section:
                 continue
 
-            heading_match = re.match(r"##\s+(.+)", section)
+            heading_match = _H2_HEADING_RE.match(section)
             if heading_match:
                 category = heading_match.group(1).strip()
-                content_body = section[len(heading_match.group(0)) :].strip()
+                content_body = section[heading_match.end() :].strip()
             else:
                 category = None
                 content_body = section
 
-            multiline_credits = self._parse_multiline_credits(content_body, category)
+            # Split once and share the line list with the multiline parser
+            lines = content_body.split("\n")
+
+            multiline_credits = self._parse_multiline_credits(lines, category)
             if multiline_credits:
                 for c in multiline_credits:
                     line_key = f"{c.get('name', '')}|{c.get('url', '')}"
@@ -452,7 +665,6 @@ class ColophonGenerator:
                         matched_lines.add(line_key)
                 continue
 
-            lines = content_body.split("\n")
             for line in lines:
                 line_stripped = line.strip()
                 if not line_stripped or line_stripped.startswith("#"):
@@ -465,13 +677,13 @@ class ColophonGenerator:
                 credit_entry = self._parse_single_credit_line(line_stripped)
                 if credit_entry:
                     if category:
-                        credit_entry["category"] = category
+                        credit_entry["category"] = sys.intern(category)
                     credits.append(credit_entry)
                     matched_lines.add(line_key)
 
         return credits
 
-    def _parse_multiline_credits(self, content: str, category: str | None) -> list[dict] | None:
+    def _parse_multiline_credits(self, lines: list[str], category: str | None) -> list[dict] | None:
         """Parse multi-line credit format where name and URL are on separate lines.
 
         Format:
@@ -479,7 +691,6 @@ class ColophonGenerator:
             - https://url
         """
         credits = []
-        lines = content.split("\n")
         i = 0
 
         while i < len(lines):
@@ -489,7 +700,7 @@ class ColophonGenerator:
                 i += 1
                 continue
 
-            name_match = re.match(r"^[-*]\s+(.+)$", line)
+            name_match = _ML_NAME_RE.match(line)
             if not name_match:
                 i += 1
                 continue
@@ -498,12 +709,12 @@ class ColophonGenerator:
 
             if i + 1 < len(lines):
                 next_line = lines[i + 1].strip()
-                url_match = re.match(r"^[-*]\s+(https?://[^\s]+)$", next_line)
+                url_match = _ML_URL_RE.match(next_line)
                 if url_match:
                     url = url_match.group(1).strip()
                     credit_entry = {"name": name, "url": url}
                     if category:
-                        credit_entry["category"] = category
+                        credit_entry["category"] = sys.intern(category)
                     credits.append(credit_entry)
                     i += 2
                     continue
@@ -514,16 +725,28 @@ class ColophonGenerator:
 
     def _parse_single_credit_line(self, line: str) -> dict | None:
         """Parse a single credit line and return a credit entry dict."""
-        link_first = re.match(r"^[-*]\s*\[([^\]]+)\]\(([^\)]+)\)(?:\s*[-:–—]\s*(.+))?$", line)
-        if link_first:
-            name, url, desc = link_first.groups()
-            return {
-                "name": name.strip(),
-                "url": url.strip(),
-                "description": desc.strip() if desc else "",
-            }
+        # Every pattern below requires a bullet marker; bail before any regex
+        if not line or line[0] not in "-*":
+            return None
 
-        link_embedded = re.match(r"^[-*]\s*(.+?)\s*\[([^\]]+)\]\(([^\)]+)\)\s*(.*)$", line)
+        # Without a "](" substring no markdown-link pattern can match, so skip
+        # straight to the link-less form
+        if "](" not in line:
+            return self._parse_linkless_credit_line(line)
+
+        # The link-first form needs "[" right after the marker; a C-speed
+        # prefix test decides that without running the pattern
+        if line[1:].lstrip().startswith("["):
+            link_first = _CREDIT_LINK_FIRST_RE.match(line)
+            if link_first:
+                name, url, desc = link_first.groups()
+                return {
+                    "name": name.strip(),
+                    "url": url.strip(),
+                    "description": desc.strip() if desc else "",
+                }
+
+        link_embedded = _CREDIT_LINK_EMBEDDED_RE.match(line)
         if link_embedded:
             prefix, name, url, suffix = link_embedded.groups()
             full_desc = f"{prefix.strip()} {name.strip()} {suffix.strip()}".strip()
@@ -533,21 +756,27 @@ class ColophonGenerator:
                 "description": full_desc,
             }
 
-        link_last = re.match(r"^[-*]\s*(.+?)\s*[-:–—]\s*(.+?)\s*\[([^\]]+)\]\(([^\)]+)\)$", line)
-        if link_last:
-            name, desc, _, url = link_last.groups()
-            return {
-                "name": name.strip(),
-                "description": desc.strip(),
-                "url": url.strip(),
-            }
-
-        no_link = re.match(r"^[-*]\s*(.+?)\s*[-:–—]\s+(.+)$", line)
+        link_at_eol = _CREDIT_LINK_AT_EOL_RE.search(line)
+        if link_at_eol:
+            name_desc = _CREDIT_NAME_DESC_RE.match(line, 0, link_at_eol.start())
+            if name_desc:
+                name, desc = name_desc.groups()
+                return {
+                    "name": name.strip(),
+                    "description": desc.strip(),
+                    "url": link_at_eol.group(2).strip(),
+                }
+
+        return self._parse_linkless_credit_line(line)
+
+    def _parse_linkless_credit_line(self, line: str) -> dict | None:
+        """Parse a credit line without a markdown link ("- Name - description")."""
+        no_link = _CREDIT_NO_LINK_RE.match(line)
         if no_link:
             name, desc = no_link.groups()
             if "[" in name or "](" in name:
                 return None
-            if re.search(r"\b[eE]-\w", name):
+            if _E_DASH_WORD_RE.search(name):
                 return None
             return {
                 "name": name.strip(),
@@ -559,8 +788,6 @@ class ColophonGenerator:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-
         return datetime.now(UTC).isoformat().replace("+00:00", "Z")
 
 
@@ -5,13 +5,26 @@ Manages creation, removal, and copying of apps with Docker configuration.
 """
 
 import argparse
+import mmap
+import os
 import re
 import shutil
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import ClassVar
 
-import git
+# Server-side markers for Next.js sources, combined into one pattern so each
+# file is scanned in a single pass over its raw bytes
+_SERVER_RE = re.compile(rb"next-auth|getServerSideProps|getInitialProps|unstable_getServerSession")
+
+# next.config.ts fields handled by _validate_next_config, combined so the file
+# is scanned once instead of once per field. Values are matched as a quoted
+# string or a bare token, so quoted values containing commas stay intact, and
+# the word boundary keeps keys like "myoutput" from matching. A bytes pattern:
+# the keys are ASCII, so the config never needs decoding at all.
+_NEXT_CFG_RE = re.compile(rb"(\b(basePath|output|assetPrefix)\s*:\s*)('[^']*'|\"[^\"]*\"|[^,}\s]+)")
 
 
 class ToolsManager:
@@ -23,13 +36,20 @@ class ToolsManager:
         self.templates_dir = self.repo_root / "templates"
         self.docker_compose_path = self.repo_root / "docker-compose.yml"
         self.apps_dir = self.repo_root / "apps"
+        # Derived paths used by the copy helpers; built once instead of
+        # re-joining Path segments on every call
+        self.simonw_tools_path = self.repo_root / "tmp" / "github" / "simonw" / "tools"
+        self.license_source = self.repo_root / "LICENSE"
 
     def new_tool(self, name: str, language: str, server: bool = False) -> None:
         """Create a new empty tool with template files."""
         print(f"Creating new tool: {name} in language {language}")
 
+        # Creating the directory doubles as the existence check (one syscall)
         app_dir = self.apps_dir / name
-        if app_dir.exists():
+        try:
+            app_dir.mkdir(parents=True)
+        except FileExistsError:
             print(f"Error: Tool '{name}' already exists", file=sys.stderr)
             sys.exit(1)
 
@@ -40,8 +60,6 @@ class ToolsManager:
         else:
             app_type = "static"
 
-        # Create app directory
-        app_dir.mkdir(parents=True)
         print(f"Created directory: {app_dir}")
 
         # Copy template files
@@ -73,6 +91,9 @@ class ToolsManager:
 
     def copy_tool(self, name: str, git_url: str, repo_path: str = "") -> None:
         """Copy a tool from a git repository."""
+        # GitPython is heavy to import; only the copy paths need it
+        import git
+
         # Parse and extract actual git URL
         actual_git_url = self._parse_git_url(git_url)
 
@@ -88,14 +109,28 @@ class ToolsManager:
             print(f"Error: Tool '{name}' already exists", file=sys.stderr)
             sys.exit(1)
 
-        # Create temporary directory for cloning
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Create temporary directory for cloning. The clone is written once
+        # and read back once, so prefer a RAM-backed location when available;
+        # TOOLS_CLONE_TMPFS overrides the choice (including back to disk).
+        tmp_root = os.environ.get("TOOLS_CLONE_TMPFS")
+        if tmp_root is None and os.path.isdir("/dev/shm"):
+            tmp_root = "/dev/shm"
+        with tempfile.TemporaryDirectory(dir=tmp_root) as temp_dir:
             temp_path = Path(temp_dir)
             print("Cloning repository to temporary directory...")
 
             try:
-                # Clone repository
-                git.Repo.clone_from(actual_git_url, temp_path)
+                # Clone repository; only a HEAD snapshot is copied out, so a
+                # shallow, single-branch clone fetches far less. When only a
+                # subtree is wanted, defer the checkout and filter out blobs
+                # so just that subtree's contents are ever downloaded.
+                clone_options = ["--depth=1", "--no-tags", "--single-branch"]
+                if repo_path:
+                    clone_options += ["--filter=blob:none", "--no-checkout"]
+                repo = git.Repo.clone_from(actual_git_url, temp_path, multi_options=clone_options)
+                if repo_path:
+                    repo.git.sparse_checkout("set", "--no-cone", f"/{repo_path}")
+                    repo.git.checkout("HEAD")
                 print("Successfully cloned repository")
 
                 # Determine source path
@@ -142,17 +177,57 @@ class ToolsManager:
                 print(f"Error cloning repository: {e}", file=sys.stderr)
                 sys.exit(1)
 
+    # Top-level marker files that identify a JS app without any extension scan
+    _JS_MARKERS = frozenset({"package.json", "next.config.ts", "next.config.js"})
+
+    # Directories the detection walks never need to enter: version control
+    # metadata and generated output. A populated node_modules alone can hold
+    # tens of thousands of files.
+    _SKIP_DIRS = frozenset({".git", "node_modules", ".next"})
+
     def _detect_language(self, app_dir: Path) -> str:
-        if len(list(app_dir.rglob("*.go"))) != 0:
+        """Detect the app language with a single walk of the tree.
+
+        One os.scandir traversal replaces up to four rglob passes; the cached
+        dirent type means no per-entry stat, and a .go hit returns immediately
+        since Go has top priority.
+        """
+        # Root-level sentinel files settle the common cases with a single
+        # directory listing and no descent. Go markers are checked first so a
+        # Go tool that also carries a package.json keeps its priority.
+        try:
+            with os.scandir(app_dir) as it:
+                root_names = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            return "unknown"
+        if "go.mod" in root_names or any(name.endswith(".go") for name in root_names):
             return "go"
-        if (
-            len(list(app_dir.rglob("*.ts"))) != 0
-            or (app_dir / "package.json").exists()
-            or (app_dir / "next.config.ts").exists()
-            or (app_dir / "next.config.js").exists()
-        ):
+        if not self._JS_MARKERS.isdisjoint(root_names):
             return "js"
-        if len(list(app_dir.rglob("*.html"))) != 0 or len(list(app_dir.rglob("*.htm"))) != 0:
+
+        found_js = False
+        found_html = False
+        stack = [str(app_dir)]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".go"):
+                        return "go"
+                    if name.endswith(".ts"):
+                        found_js = True
+                    elif name.endswith((".html", ".htm")):
+                        found_html = True
+                    if name not in self._SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        if found_js:
+            return "js"
+        if found_html:
             return "html"
         return "unknown"
 
@@ -165,41 +240,90 @@ class ToolsManager:
             app_dir / "app" / "api",
         ]
         for api_dir in api_dirs:
-            if api_dir.exists() and (any(api_dir.rglob("*.ts")) or any(api_dir.rglob("*.js"))):
+            if self._dir_has_route_files(str(api_dir)):
                 return "server"
 
-        # Check for server-side patterns in source files
-        server_patterns = [
-            "next-auth",
-            "getServerSideProps",
-            "getInitialProps",
-            "unstable_getServerSession",
-        ]
-
-        for ts_file in app_dir.rglob("*.ts"):
-            try:
-                content = ts_file.read_text()
-                for pattern in server_patterns:
-                    if pattern in content:
-                        return "server"
-            except (OSError, UnicodeDecodeError):
-                pass
-
-        for tsx_file in app_dir.rglob("*.tsx"):
+        # Check for server-side patterns in source files: one walk covers both
+        # .ts and .tsx, collecting candidates for the scan below
+        candidates = []
+        stack = [str(app_dir)]
+        while stack:
+            current = stack.pop()
             try:
-                content = tsx_file.read_text()
-                for pattern in server_patterns:
-                    if pattern in content:
-                        return "server"
-            except (OSError, UnicodeDecodeError):
-                pass
+                entries = os.scandir(current)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self._SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith((".ts", ".tsx")):
+                        candidates.append(entry.path)
+
+        if not candidates:
+            return "static"
+
+        # The per-file scans are I/O-bound and release the GIL in mmap/regex,
+        # so run them concurrently and stop at the first positive result
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            futures = [executor.submit(self._has_server_marker, path) for path in candidates]
+            for future in as_completed(futures):
+                if future.result():
+                    for pending in futures:
+                        pending.cancel()
+                    return "server"
 
         return "static"
 
+    @staticmethod
+    def _dir_has_route_files(api_dir: str) -> bool:
+        """Check for any .ts/.js file under a candidate API directory.
+
+        One walk covers both extensions and stops at the first hit; a missing
+        candidate just fails the initial scandir instead of a separate
+        exists() probe.
+        """
+        stack = [api_dir]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ToolsManager._SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith((".ts", ".js")):
+                        return True
+        return False
+
+    @staticmethod
+    def _has_server_marker(path: str) -> bool:
+        """Search a source file for server-only markers without copying it.
+
+        mmap gives the regex engine a zero-copy view of the file, so the scan
+        reads straight from the page cache instead of a heap buffer.
+        """
+        try:
+            with open(path, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return _SERVER_RE.search(mm) is not None
+                except ValueError:
+                    # Empty files cannot be mapped (and cannot match)
+                    return False
+        except OSError:
+            return False
+
     def _validate_next_config(self, name: str, app_type: str) -> bool:
         """Validate next.config.ts for copy mode."""
         config_path = self.apps_dir / name / "next.config.ts"
-        if not config_path.exists():
+        try:
+            content = config_path.read_bytes()
+        except FileNotFoundError:
             expected_fields = ["basePath"]
             if app_type == "static":
                 expected_fields.extend(["assetPrefix", "output"])
@@ -211,133 +335,97 @@ class ToolsManager:
             )
             sys.exit(1)
 
-        with open(config_path, encoding="utf-8") as f:
-            content = f.read()
+        # Fields to rewrite for this app type; assetPrefix only applies to
+        # static exports
+        replacements = {
+            b"basePath": f"'/{name}'".encode(),
+            b"output": b"'export'" if app_type == "static" else b"'standalone'",
+        }
+        if app_type == "static":
+            replacements[b"assetPrefix"] = f"'/{name}'".encode()
 
         modified = False
 
-        # Always set basePath
-        base_path_value = f"'/{name}'"
-        if re.search(r"basePath\s*:\s*[^,]+", content):
-            content, count = re.subn(r"(basePath\s*:\s*)[^,]+", rf"\1{base_path_value}", content)
-            if count > 0:
-                modified = True
+        def _replace(match: re.Match) -> bytes:
+            nonlocal modified
+            value = replacements.get(match.group(2))
+            if value is None:
+                return match.group(0)
+            modified = True
+            return match.group(1) + value
 
-        # Set output
-        if app_type == "static":
-            output_value = "'export'"
-        else:
-            output_value = "'standalone'"
-        if re.search(r"output\s*:\s*[^,]+", content):
-            content, count = re.subn(r"(output\s*:\s*)[^,]+", rf"\1{output_value}", content)
-            if count > 0:
-                modified = True
-
-        # For static, set assetPrefix
-        if app_type == "static":
-            asset_prefix_value = f"'/{name}'"
-            if re.search(r"assetPrefix\s*:\s*[^,]+", content):
-                content, count = re.subn(
-                    r"(assetPrefix\s*:\s*)[^,]+", rf"\1{asset_prefix_value}", content
-                )
-                if count > 0:
-                    modified = True
+        # One pass over the file instead of a search+subn pair per field
+        content = _NEXT_CFG_RE.sub(_replace, content)
 
         return modified
 
+    # Per-(language, app_type) template copy plan; app_type is only
+    # significant for JS apps. Computed once instead of an if-ladder per call.
+    _TEMPLATE_PLAN: ClassVar[dict[tuple[str, str | None], list[tuple[str, str]]]] = {
+        ("go", None): [
+            (".dockerignore.go", ".dockerignore"),
+            ("Dockerfile.go.template", "Dockerfile"),
+        ],
+        ("js", "static"): [
+            (".dockerignore.js", ".dockerignore"),
+            ("Dockerfile.js.static.template", "Dockerfile"),
+        ],
+        ("js", "server"): [
+            (".dockerignore.js", ".dockerignore"),
+            ("Dockerfile.js.server.template", "Dockerfile"),
+        ],
+        ("html", None): [
+            (".dockerignore.html", ".dockerignore"),
+            ("Dockerfile.html.template", "Dockerfile"),
+        ],
+    }
+
+    _HTML_SCAFFOLD: ClassVar[list[tuple[str, str]]] = [
+        ("index.html", "index.html"),
+        ("style.css", "style.css"),
+    ]
+
     def _copy_template_files(
         self, dest_dir: Path, app_language: str, app_type: str | None = None
     ) -> None:
         """Copy template files to destination directory."""
-        if not self.templates_dir.exists():
+        # One directory listing replaces a stat per template probe (and
+        # doubles as the templates-directory existence check)
+        try:
+            with os.scandir(self.templates_dir) as it:
+                available = {entry.name: entry.path for entry in it if entry.is_file()}
+        except OSError:
             print(f"Warning: Templates directory not found at {self.templates_dir}")
             return
 
-        template_files = {
-            "all": {
-                "app.env": "app.env",
-            },
-            "dockerignore": {
-                "go": ".dockerignore.go",
-                "js": ".dockerignore.js",
-                "html": ".dockerignore.html",
-            },
-            "dockerfile": {
-                "go": "Dockerfile.go.template",
-                "js-static": "Dockerfile.js.static.template",
-                "js-server": "Dockerfile.js.server.template",
-                "html": "Dockerfile.html.template",
-            },
-            "html_scaffold": {
-                "index.html": "index.html",
-                "style.css": "style.css",
-            },
-        }
-
         # Determine app_type for JS
         if app_language == "js" and app_type is None:
             app_type = self._detect_app_type(dest_dir)
             print(f"Detected app type: {app_type} for JS app")
 
-        # common files
-        for template_name, dest_name in template_files["all"].items():
-            template_path = self.templates_dir / template_name
-            if template_path.exists():
-                dest_path = dest_dir / dest_name
-                shutil.copy2(template_path, dest_path)
-                print(f"  Copied: {dest_name}")
+        # Common files plus the language-specific plan, copied in one loop.
+        # Destinations are joined as plain strings; the scandir map already
+        # holds source paths as strings, so no Path objects are built here.
+        plan_key = (app_language, app_type if app_language == "js" else None)
+        plan = [("app.env", "app.env"), *self._TEMPLATE_PLAN.get(plan_key, [])]
+        dest_root = os.fspath(dest_dir)
+
+        for template_name, dest_name in plan:
+            template_path = available.get(template_name)
+            if template_path is not None:
+                shutil.copyfile(template_path, os.path.join(dest_root, dest_name))
+                print(f"  Copied: {template_name} as {dest_name}")
             else:
                 print(f"  Warning: Template '{template_name}' not found")
 
-        # Copy language-specific .dockerignore
-        dockerignore_templates = template_files["dockerignore"]
-        if app_language in dockerignore_templates:
-            template_path = self.templates_dir / dockerignore_templates[app_language]
-            if template_path.exists():
-                dest_path = dest_dir / ".dockerignore"
-                shutil.copy2(template_path, dest_path)
-                print(f"Copied: .dockerignore for {app_language}")
-            else:
-                print(f"Warning: Template '{dockerignore_templates[app_language]}' not found")
-
-        # Copy language-specific Dockerfile
-        dockerfile_templates = template_files["dockerfile"]
-        if app_language == "go" and "go" in dockerfile_templates:
-            template_path = self.templates_dir / dockerfile_templates["go"]
-            if template_path.exists():
-                dest_path = dest_dir / "Dockerfile"
-                shutil.copy2(template_path, dest_path)
-                print("Copied: Dockerfile.go.template")
-            else:
-                print("Warning: Template 'Dockerfile.go.template' not found")
-        elif app_language == "js" and app_type in ["static", "server"]:
-            template_key = f"js-{app_type}"
-            if template_key in dockerfile_templates:
-                template_path = self.templates_dir / dockerfile_templates[template_key]
-                if template_path.exists():
-                    dest_path = dest_dir / "Dockerfile"
-                    shutil.copy2(template_path, dest_path)
-                    print(f"  Copied: {dockerfile_templates[template_key]} as Dockerfile.js")
-                else:
-                    print(f"  Warning: Template '{dockerfile_templates[template_key]}' not found")
-        elif app_language == "html" and "html" in dockerfile_templates:
-            template_path = self.templates_dir / dockerfile_templates["html"]
-            if template_path.exists():
-                dest_path = dest_dir / "Dockerfile"
-                shutil.copy2(template_path, dest_path)
-                print("Copied: Dockerfile.html.template")
-            else:
-                print("Warning: Template 'Dockerfile.html.template' not found")
-
         # Copy HTML scaffold files (index.html, style.css) for HTML apps
         if app_language == "html":
-            html_scaffold = template_files["html_scaffold"]
-            for template_name, dest_name in html_scaffold.items():
-                template_path = self.templates_dir / template_name
-                dest_path = dest_dir / dest_name
-                if not dest_path.exists():
-                    if template_path.exists():
-                        shutil.copy2(template_path, dest_path)
+            for template_name, dest_name in self._HTML_SCAFFOLD:
+                template_path = available.get(template_name)
+                dest_path = os.path.join(dest_root, dest_name)
+                if not os.path.exists(dest_path):
+                    if template_path is not None:
+                        shutil.copyfile(template_path, dest_path)
                         print(f"  Copied: {dest_name}")
                     else:
                         print(f"  Warning: Template '{template_name}' not found")
@@ -394,23 +482,37 @@ make up     # Production
                 return
             dest_path = dest / source.name
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest_path)
+            shutil.copyfile(source, dest_path)
             print(f"  Copied: {source.name}")
             return
 
         # Handle directory
-        for item in source.rglob("*"):
-            # Skip .git directory
-            if ".git" in item.parts:
-                continue
+        self._copy_tree(str(source), str(dest))
 
-            # Calculate relative path
-            rel_path = item.relative_to(source)
-            dest_path = dest / rel_path
+    def _copy_tree(self, src_dir: str, dst_dir: str) -> None:
+        """Recursively copy a directory, pruning .git instead of filtering it out.
 
-            if item.is_file():
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, dest_path)
+        scandir's cached entry types avoid a stat per path, the destination
+        directory is created at most once per level (not once per file), and
+        .git subtrees are never descended into. Empty directories are not
+        replicated, matching the old rglob+is_file behavior.
+        """
+        dir_made = False
+        try:
+            entries = os.scandir(src_dir)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.name == ".git":
+                    continue
+                if entry.is_dir():
+                    self._copy_tree(entry.path, os.path.join(dst_dir, entry.name))
+                elif entry.is_file():
+                    if not dir_made:
+                        os.makedirs(dst_dir, exist_ok=True)
+                        dir_made = True
+                    shutil.copyfile(entry.path, os.path.join(dst_dir, entry.name))
 
     def _parse_git_url(self, input_url: str) -> str:
         """
@@ -431,29 +533,38 @@ make up     # Production
         # Otherwise, assume it's a standard git URL
         return input_url.strip()
 
+    # URL spellings that refer to simonw/tools; an optional .git suffix is
+    # stripped before lookup
+    _SIMONW_URLS = frozenset(
+        {
+            "https://github.com/simonw/tools",
+            "github.com/simonw/tools",
+            "simonw/tools",
+        }
+    )
+
     def _is_simonw_tools_repo(self, git_url: str) -> bool:
         """Check if the git URL is for simonw/tools repository."""
-        # Various URL formats to check
-        patterns = [
-            r"https://github\.com/simonw/tools(\.git)?$",
-            r"github\.com/simonw/tools(\.git)?$",
-            r"^simonw/tools(\.git)?$",
-        ]
-        for pattern in patterns:
-            if re.match(pattern, git_url):
-                return True
-        return False
+        # The old regexes were fully anchored literals, so a set lookup is an
+        # exact (and allocation-free) replacement
+        return git_url.removesuffix(".git") in self._SIMONW_URLS
 
     def _copy_from_simonw_tools(self, name: str, repo_path: str) -> None:
         """Copy a tool from the local simonw/tools clone or clone if needed."""
-        simonw_tools_path = self.repo_root / "tmp" / "github" / "simonw" / "tools"
+        import git
+
+        simonw_tools_path = self.simonw_tools_path
 
         # 1. Check for locally cloned repo
         if not simonw_tools_path.exists():
             print("Cloning simonw/tools to local cache...")
             simonw_tools_path.parent.mkdir(parents=True, exist_ok=True)
             try:
-                git.Repo.clone_from("https://github.com/simonw/tools.git", simonw_tools_path)
+                git.Repo.clone_from(
+                    "https://github.com/simonw/tools.git",
+                    simonw_tools_path,
+                    multi_options=["--depth=1", "--no-tags", "--single-branch"],
+                )
                 print(f"Successfully cloned simonw/tools to {simonw_tools_path}")
             except git.GitCommandError as e:
                 print(f"Error cloning simonw/tools: {e}", file=sys.stderr)
@@ -471,13 +582,14 @@ make up     # Production
             print(f"Error: Path '{repo_path}' not found in simonw/tools", file=sys.stderr)
             sys.exit(1)
 
-        # 3. Create app directory
+        # 3. Create app directory; mkdir doubles as the existence check
         app_dir = self.apps_dir / name
-        if app_dir.exists():
+        try:
+            app_dir.mkdir(parents=True)
+        except FileExistsError:
             print(f"Error: Tool '{name}' already exists", file=sys.stderr)
             sys.exit(1)
 
-        app_dir.mkdir(parents=True)
         print(f"Created directory: {app_dir}")
 
         # 4. Copy files from source
@@ -520,8 +632,7 @@ make up     # Production
         app_name = app_name.removesuffix(".html")
 
         docs_filename = f"{app_name}.docs.md"
-        simonw_tools_path = self.repo_root / "tmp" / "github" / "simonw" / "tools"
-        docs_source = simonw_tools_path / docs_filename
+        docs_source = self.simonw_tools_path / docs_filename
         readme_path = app_dir / "README.md"
 
         # Build the source URL for credit
@@ -560,14 +671,23 @@ When editing, keep the wrapper structure in `index.html`:
 
     def _copy_license(self, app_dir: Path) -> None:
         """Copy Apache 2.0 license to the app directory."""
-        license_source = self.repo_root / "LICENSE"
         license_dest = app_dir / "LICENSE"
 
-        if license_source.exists():
-            shutil.copy2(license_source, license_dest)
-            print(f"Copied LICENSE to {app_dir.name}")
+        try:
+            shutil.copyfile(self.license_source, license_dest)
+        except FileNotFoundError:
+            print(f"Warning: LICENSE file not found at {self.license_source}")
         else:
-            print(f"Warning: LICENSE file not found at {license_source}")
+            print(f"Copied LICENSE to {app_dir.name}")
+
+
+def _find_repo_root() -> Path | None:
+    """Locate the repository root by walking up from cwd looking for .git."""
+    current = Path.cwd()
+    for candidate in (current, *current.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
 
 
 def main():
@@ -610,13 +730,12 @@ Examples:
 
     args = parser.parse_args()
 
-    # Initialize manager
-    git_repo = git.Repo(search_parent_directories=True)
-    if git_repo.working_tree_dir is None:
+    # Initialize manager; a plain parent walk finds the repo root without
+    # paying the GitPython import for every command
+    git_root = _find_repo_root()
+    if git_root is None:
         print("Error: Could not determine repository working tree directory", file=sys.stderr)
         sys.exit(1)
-    assert git_repo.working_tree_dir is not None
-    git_root = Path(git_repo.working_tree_dir)
     manager = ToolsManager(git_root)
 
     # Execute command